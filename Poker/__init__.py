@@ -2,5 +2,24 @@
 from .game import PokerGame
 from .deck import Deck
 from .player import Player
+from .tournament import Tournament, icm_equities
+from .stats import StatsTracker
+from .outs import analyze_outs, classify_draws
+from .abstraction import ActionAbstraction
+from .duplicate import duplicate_match
+from .pushfold import PushFoldChart, solve_push_fold
+from .ranges import parse_range
+from .equity import range_equity, combo_equity_matrix
+from .selfplay import SampleRecorder, ShardDataset, generate_parallel
 
-__all__ = ["PokerGame", "Deck", "Player"]
+__all__ = [
+    "PokerGame", "Deck", "Player",
+    "Tournament", "icm_equities",
+    "StatsTracker",
+    "analyze_outs", "classify_draws",
+    "ActionAbstraction",
+    "duplicate_match",
+    "PushFoldChart", "solve_push_fold",
+    "parse_range", "range_equity", "combo_equity_matrix",
+    "SampleRecorder", "ShardDataset", "generate_parallel",
+]
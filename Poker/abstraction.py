@@ -0,0 +1,118 @@
+# Fixed slots at the front of every abstraction; bet sizes follow, all-in is always the last slot
+FOLD = 0
+CHECK = 1
+CALL = 2
+FIRST_BET = 3
+
+
+class ActionAbstraction:
+    def __init__(self, pot_fractions=(1/3, 1/2, 3/4, 1.0, 2.0)):
+        """
+        Maps the continuous raise range onto a few pot-relative sizes.
+        Action i is a plain int: FOLD, CHECK, CALL, then one slot per pot fraction, then ALL_IN.
+        The legal set of a decision is an int bitmask over those slots, so strategy arrays can be
+        indexed directly and nothing is allocated per decision.
+        """
+        self.pot_fractions = tuple(sorted(pot_fractions))
+        self.all_in = FIRST_BET + len(self.pot_fractions)
+        self.num_actions = self.all_in + 1
+
+    def action_name(self, index):
+        if index == FOLD:
+            return "FOLD"
+        if index == CHECK:
+            return "CHECK"
+        if index == CALL:
+            return "CALL"
+        if index == self.all_in:
+            return "ALL_IN"
+        return f"BET_{self.pot_fractions[index - FIRST_BET]:.2f}_POT"
+
+    def raise_bounds(self, game, actor_index):
+        """(to_call, min raise to-level, all-in to-level) with the same rules as PokerGame.legal_actions"""
+        p = game.players[actor_index]
+        to_call = max(0, game.current_bet - p.current_bet)
+        max_to = p.current_bet + p.chips
+        if game.current_bet == 0:
+            min_target = game.big_blind_amount
+        else:
+            base = game.last_raise_size if game.last_raise_size > 0 else game.big_blind_amount
+            min_target = game.current_bet + base
+        return to_call, min_target, max_to
+
+    def bet_target(self, game, to_call, fraction):
+        """To-level for a raise of `fraction` of the pot after calling (pot-sized raise = 1.0)"""
+        return game.current_bet + int(fraction * (game.live_pot() + to_call))
+
+    def legal_mask(self, game, actor_index):
+        """Bitmask of the abstract actions available to the player at `actor_index` (0 if they can't act)"""
+        p = game.players[actor_index]
+        if p.folded or p.chips == 0:
+            return 0
+
+        to_call, min_target, max_to = self.raise_bounds(game, actor_index)
+        mask = 1 << CHECK if to_call == 0 else (1 << CALL) | (1 << FOLD)
+
+        if max_to > game.current_bet:
+            mask |= 1 << self.all_in
+            for i, fraction in enumerate(self.pot_fractions):
+                target = self.bet_target(game, to_call, fraction)
+                if target >= max_to: #sizes at or past the stack collapse into ALL_IN
+                    break
+                if target >= min_target:
+                    mask |= 1 << (FIRST_BET + i)
+        return mask
+
+    def to_game_action(self, game, actor_index, index):
+        """Turns an abstract action into the (kind, amount) tuple PokerGame.betting_round applies"""
+        if index == FOLD:
+            return ("FOLD", 0)
+        if index == CHECK:
+            return ("CHECK", 0)
+
+        p = game.players[actor_index]
+        to_call, min_target, max_to = self.raise_bounds(game, actor_index)
+        if index == CALL:
+            return ("CALL", min(to_call, p.chips))
+        if index == self.all_in:
+            return ("RAISE_TO", max_to)
+        target = self.bet_target(game, to_call, self.pot_fractions[index - FIRST_BET])
+        return ("RAISE_TO", min(max(target, min_target), max_to))
+
+    def from_game_action(self, game, actor_index, act):
+        """
+        Maps a real action (kind, amount) onto the abstraction, e.g. an opponent's off-tree bet size.
+        Must be called before the action is applied, i.e. from a listener's on_action.
+        """
+        kind = act[0]
+        if kind == "FOLD":
+            return FOLD
+        if kind == "CHECK":
+            return CHECK
+        if kind == "CALL":
+            return CALL
+
+        to_call, min_target, max_to = self.raise_bounds(game, actor_index)
+        target_to = act[1]
+        if target_to >= max_to:
+            return self.all_in
+        pot = game.live_pot() + to_call
+        fraction = (target_to - game.current_bet) / pot if pot else float("inf")
+        return self.nearest_size(fraction, (max_to - game.current_bet) / pot if pot else float("inf"))
+
+    def nearest_size(self, fraction, all_in_fraction):
+        """
+        Closest abstract size to a pot fraction, using the pseudo-harmonic mapping:
+        between sizes A < x < B, x maps to A when (B - x)(1 + A) > (x - A)(1 + B).
+        This is less exploitable than plain nearest-distance because it treats sizes relative to the pot.
+        """
+        sizes = [f for f in self.pot_fractions if f < all_in_fraction] + [all_in_fraction]
+        indices = [FIRST_BET + i for i, f in enumerate(self.pot_fractions) if f < all_in_fraction] + [self.all_in]
+
+        if fraction <= sizes[0]:
+            return indices[0]
+        for j in range(1, len(sizes)):
+            if fraction <= sizes[j]:
+                a, b = sizes[j - 1], sizes[j]
+                return indices[j - 1] if (b - fraction) * (1 + a) > (fraction - a) * (1 + b) else indices[j]
+        return indices[-1]
@@ -0,0 +1,237 @@
+import os
+import random
+from itertools import combinations
+
+import numpy as np
+
+from deck import Deck
+from hand_evaluator import evaluate_hand
+
+# Ranks high to low, the order preflop charts use
+RANKS = ['A', 'K', 'Q', 'J', '10', '9', '8', '7', '6', '5', '4', '3', '2']
+RANK_CHAR = {'10': 'T'} #single-character rank for hand class names like "T9s"
+
+CARDS = Deck().cards #fixed order, card index = position in this list
+CARD_INDEX = {(c.rank, c.suit): i for i, c in enumerate(CARDS)}
+
+# All 1326 two-card combinations; every combination-indexed array uses this order
+COMBOS = list(combinations(range(52), 2))
+COMBO_INDEX = {pair: i for i, pair in enumerate(COMBOS)}
+COMBO_CARDS = np.array(COMBOS, dtype=np.int16) #(1326, 2) card indices
+
+
+def card_index(card):
+    return CARD_INDEX[(card.rank, card.suit)]
+
+
+def card_mask(card_indices):
+    """One 52-bit int with a bit per card"""
+    mask = 0
+    for i in card_indices:
+        mask |= 1 << i
+    return mask
+
+
+def rank_name(rank):
+    return RANK_CHAR.get(rank, rank)
+
+
+def class_index(card_a, card_b):
+    """
+    Index 0-168 of a hand class in the usual 13x13 chart layout (row * 13 + col, Ace first):
+    pairs on the diagonal, suited hands above it, offsuit hands below it.
+    """
+    hi, lo = sorted((RANKS.index(card_a.rank), RANKS.index(card_b.rank)))
+    if card_a.suit == card_b.suit:
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def class_name(index):
+    row, col = divmod(index, 13)
+    if row == col:
+        return rank_name(RANKS[row]) * 2
+    if row < col:
+        return rank_name(RANKS[row]) + rank_name(RANKS[col]) + "s"
+    return rank_name(RANKS[col]) + rank_name(RANKS[row]) + "o"
+
+
+CLASS_NAMES = [class_name(i) for i in range(169)]
+COMBO_CLASS = np.array([class_index(CARDS[a], CARDS[b]) for a, b in COMBOS], dtype=np.int16)
+CLASS_COMBOS = np.bincount(COMBO_CLASS, minlength=169) #6 per pair, 4 suited, 12 offsuit
+
+# (1326, 1326) True where two combinations share no card and can be dealt together
+_combo_bits = np.zeros((len(COMBOS), 52), dtype=bool)
+_combo_bits[np.arange(len(COMBOS))[:, None], COMBO_CARDS] = True
+COMBO_COMPATIBLE = ~(_combo_bits.astype(np.uint8) @ _combo_bits.T.astype(np.uint8)).astype(bool)
+
+
+def strength_key(cards):
+    """evaluate_hand's (rank_value, tiebreakers) packed into one int, so hands compare with > and =="""
+    rank_value, tiebreakers, _ = evaluate_hand(cards)
+    key = rank_value
+    for k in range(5):
+        key = key * 15 + (tiebreakers[k] if k < len(tiebreakers) else 0)
+    return key
+
+
+# Per-card rank (0 = deuce ... 12 = Ace) and suit (0-3) for the vectorized evaluator
+CARD_RANK = np.array([c.value - 2 for c in CARDS], dtype=np.int64)
+CARD_SUIT = np.array(['♠♥♦♣'.index(c.suit) for c in CARDS], dtype=np.int64)
+KEY_PLACES = 15 ** np.arange(5, dtype=np.int64)[::-1] #tiebreaker weights, as in strength_key
+
+
+def _rank_mask_tables():
+    """
+    Lookups over every 13-bit rank mask: highest rank in it, top card value of its best straight
+    (5 for the wheel, 0 for none) and its 5 highest card values packed like strength_key's tiebreakers.
+    """
+    high = np.full(1 << 13, -1, dtype=np.int64)
+    straight = np.zeros(1 << 13, dtype=np.int64)
+    top5 = np.zeros(1 << 13, dtype=np.int64)
+    windows = [(0b11111 << low, low + 6) for low in range(8, -1, -1)] + [(0b1000000001111, 5)]
+    for mask in range(1, 1 << 13):
+        ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+        high[mask] = ranks[0]
+        straight[mask] = next((top for window, top in windows if mask & window == window), 0)
+        top5[mask] = sum((r + 2) * int(KEY_PLACES[k]) for k, r in enumerate(ranks[:5]))
+    return high, straight, top5
+
+
+HIGH_RANK, STRAIGHT_TOP, TOP5_KEY = _rank_mask_tables()
+
+
+def board_strengths(board, only=None):
+    """
+    River strength of every combination on a full 5-card board, as an int64 array over COMBOS with
+    -1 for combinations that use a board card. Same keys as strength_key, but computed for all
+    combinations at once in NumPy from rank counts and rank bitmasks, so the board's share of the
+    work is done once per board instead of once per combination.
+    only: optional combo indices to score (the rest stay -1), e.g. just the combos in play.
+    """
+    idx = np.arange(len(COMBOS)) if only is None else np.asarray(only, dtype=np.int64)
+    strengths = np.full(len(COMBOS), -1, dtype=np.int64)
+    idx = idx[~np.isin(COMBO_CARDS[idx], board).any(axis=1)]
+    if len(idx) == 0:
+        return strengths
+
+    cards = np.concatenate([COMBO_CARDS[idx].astype(np.int64), np.broadcast_to(np.asarray(board), (len(idx), 5))], axis=1)
+    ranks, suits = CARD_RANK[cards], CARD_SUIT[cards] #(m, 7)
+    bits = np.int64(1) << ranks
+    counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1) #(m, 13) cards per rank
+    mask = ((counts > 0) * (np.int64(1) << np.arange(13))).sum(axis=1)
+
+    suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+    flush_suit = suit_counts.argmax(axis=1)
+    has_flush = suit_counts.max(axis=1) >= 5
+    suited = (bits * (suits == flush_suit[:, None])).sum(axis=1) #ranks within a suit never repeat
+    straight_flush = np.where(has_flush, STRAIGHT_TOP[suited], 0)
+
+    #ranks ordered by (count, rank), highest first: groups[:, 0] is the biggest set of cards
+    groups = -np.sort(-(counts * 16 + np.arange(13)), axis=1)[:, :4]
+    group_rank, group_count = groups % 16, groups // 16
+    r0, r1, r2, r3 = (group_rank[:, k] + 2 for k in range(4))
+    c0, c1 = group_count[:, 0], group_count[:, 1]
+    one = np.int64(1)
+    quad_kicker = HIGH_RANK[mask & ~(one << group_rank[:, 0])] + 2
+    two_pair_kicker = HIGH_RANK[mask & ~(one << group_rank[:, 0]) & ~(one << group_rank[:, 1])] + 2
+    straight = STRAIGHT_TOP[mask]
+    p4, p3, p2, p1, _ = KEY_PLACES
+
+    strengths[idx] = np.select(
+        [straight_flush > 0, c0 == 4, (c0 == 3) & (c1 >= 2), has_flush, straight > 0,
+         c0 == 3, (c0 == 2) & (c1 == 2), c0 == 2],
+        [8 * 15 ** 5 + straight_flush * p4,
+         7 * 15 ** 5 + r0 * p4 + quad_kicker * p3,
+         6 * 15 ** 5 + r0 * p4 + r1 * p3,
+         5 * 15 ** 5 + TOP5_KEY[suited],
+         4 * 15 ** 5 + straight * p4,
+         3 * 15 ** 5 + r0 * p4 + r1 * p3 + r2 * p2,
+         2 * 15 ** 5 + r0 * p4 + r1 * p3 + two_pair_kicker * p2,
+         1 * 15 ** 5 + r0 * p4 + r1 * p3 + r2 * p2 + r3 * p1],
+        TOP5_KEY[mask])
+    return strengths
+
+
+def showdown_totals(strengths, compatible=COMBO_COMPATIBLE):
+    """
+    Pairwise showdowns of n combinations over many run-outs at once.
+    strengths: (run-outs, n) rows of board_strengths for the same n combos, -1 where a combo is dead
+    compatible: matching (n, n) slice of COMBO_COMPATIBLE
+    Returns (points, counts): points[i, j] gets 1 for each win of combo i over combo j and 0.5 for
+    each tie, counts[i, j] counts the run-outs both could be dealt on (0 for pairs sharing a card).
+    Each run-out costs one small-int n x n sign pass; counts come from a single matrix product.
+    """
+    strengths = np.asarray(strengths)
+    n = strengths.shape[1]
+    live = (strengths >= 0).astype(np.float32)
+    both = (live.T @ live).astype(np.float64) #run-outs on which both combos are live
+
+    net = np.zeros((n, n), dtype=np.int16 if len(strengths) < 2 ** 15 else np.int32) #wins minus losses
+    diff = np.empty_like(net)
+    for row in strengths:
+        dense = np.unique(row, return_inverse=True)[1].astype(net.dtype) #small ints keep the n x n pass cheap
+        np.subtract.outer(dense, dense, out=diff)
+        np.sign(diff, out=diff)
+        net += diff
+
+    alive = live.sum(axis=0, dtype=np.float64)
+    net = net - (alive[:, None] - alive[None, :]) #dead rows (-1) "lost" to every live combo: take those out
+    points = (net + both) / 2 * compatible #wins + ties / 2 = (wins - losses + showdowns) / 2
+    counts = both * compatible
+    return points, counts
+
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+
+def class_onehot():
+    """(1326, 169) matrix mapping every combination onto its hand class"""
+    onehot = np.zeros((len(COMBOS), 169))
+    onehot[np.arange(len(COMBOS)), COMBO_CLASS] = 1.0
+    return onehot
+
+
+def preflop_equity_matrix(boards=1000, seed=0, cache_dir=CACHE_DIR):
+    """
+    All-in preflop equity of every hand class against every other, from `boards` random boards.
+    Each board scores all 1326 combinations at once with board_strengths and compares every pair,
+    so every class matchup gets boards * (combo pairs) samples.
+    Returns (equity, weights): equity[h, v] is h's share of the pot against v, weights[h, v] the
+    number of combo pairs that can be dealt together (for card removal).
+    The first call per (boards, seed) builds it, about 3ms per board (a few seconds at the default
+    1000 boards); after that it loads from the .npz cache in cache_dir.
+    """
+    path = os.path.join(cache_dir, f"preflop_equity_{boards}_{seed}.npz")
+    if os.path.exists(path):
+        cached = np.load(path)
+        return cached["equity"], cached["weights"]
+
+    rng = random.Random(seed)
+    points = np.zeros((len(COMBOS), len(COMBOS)))
+    counts = np.zeros((len(COMBOS), len(COMBOS)))
+    for start in range(0, boards, 1000): #chunks keep the (boards, 1326) strength rows small
+        rows = [board_strengths(rng.sample(range(52), 5)) for _ in range(min(1000, boards - start))]
+        chunk_points, chunk_counts = showdown_totals(rows)
+        points += chunk_points
+        counts += chunk_counts
+
+    onehot = class_onehot()
+    class_points = onehot.T @ points @ onehot
+    class_counts = onehot.T @ counts @ onehot
+    equity = class_points / np.maximum(class_counts, 1)
+    weights = onehot.T @ COMBO_COMPATIBLE.astype(float) @ onehot
+
+    os.makedirs(cache_dir, exist_ok=True)
+    np.savez(path, equity=equity, weights=weights)
+    return equity, weights
+
+
+def preflop_ranking():
+    """
+    Hand classes from strongest to weakest by all-in equity against a random hand.
+    Built from preflop_equity_matrix(), so the first call on a cold cache takes a few seconds.
+    """
+    equity, weights = preflop_equity_matrix()
+    vs_random = (weights * equity).sum(axis=1) / weights.sum(axis=1)
+    return np.argsort(-vs_random, kind="stable")
@@ -45,8 +45,9 @@ class Deck:
     def __str__(self):
         return ', '.join(str(card) for card in self.cards) #to print deck
 
-    def shuffle(self):
-        random.shuffle(self.cards) #shuffle's cards
+    def shuffle(self, rng=None):
+        """Shuffles the cards, with `rng` (a random.Random) when given so deals can be replayed"""
+        (rng or random).shuffle(self.cards) #shuffle's cards
 
     def deal(self, num=1):
         """Deal `num` cards and remove them from the deck."""
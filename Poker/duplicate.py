@@ -0,0 +1,134 @@
+import math
+import random
+from itertools import combinations
+from multiprocessing import Pool
+
+from deck import Deck
+from game import PokerGame
+from hand_evaluator import evaluate_hand
+
+
+class AllInLuckAdjuster:
+    """
+    Listener that removes board luck once betting is over: if the last decision of the hand was
+    made before the river, the result is replaced by each player's expected share of the pots
+    over the remaining run-outs (an all-in EV adjustment, the equity part of AIVAT).
+    """
+    def __init__(self, samples=200, rng=None):
+        self.samples = samples
+        self.rng = rng or random.Random()
+        self.adjusted = None #name -> expected chips after the hand, when an adjustment applied
+
+    def on_hand_start(self, game):
+        self.board_at_last_action = 0
+        self.adjusted = None
+
+    def on_action(self, game, actor_index, act):
+        self.board_at_last_action = len(game.community_cards)
+
+    def on_showdown(self, game, contenders):
+        board = game.community_cards[:self.board_at_last_action]
+        missing = 5 - len(board)
+        if len(contenders) < 2 or missing == 0:
+            return
+
+        known = {(c.rank, c.suit) for c in board}
+        known.update((c.rank, c.suit) for p in game.players for c in p.hole_cards)
+        unseen = [c for c in Deck().cards if (c.rank, c.suit) not in known]
+
+        if math.comb(len(unseen), missing) <= self.samples: #few enough run-outs to enumerate them all
+            runouts = list(combinations(unseen, missing))
+        else:
+            runouts = [self.rng.sample(unseen, missing) for _ in range(self.samples)]
+
+        expected = {p.name: 0.0 for p in contenders}
+        for runout in runouts:
+            full_board = board + list(runout)
+            keys = {p.name: evaluate_hand(p.hole_cards + full_board)[:2] for p in contenders}
+            for pot in game.pots:
+                elig = [p.name for p in contenders if p in pot["eligible"]]
+                if not elig:
+                    continue
+                best = max(keys[name] for name in elig)
+                winners = [name for name in elig if keys[name] == best]
+                for name in winners:
+                    expected[name] += pot["amount"] / len(winners)
+
+        self.adjusted = {p.name: float(p.chips) for p in game.players} #pots are collected but not yet paid out
+        for name, share in expected.items():
+            self.adjusted[name] += share / len(runouts)
+
+
+def play_deal(bots, deal_seed, rotation, small_blind, big_blind, stack, luck_correction, samples):
+    """
+    Plays one deal with the seats rotated by `rotation`. The deck comes from deal_seed only and the
+    button is always seat 0, so every rotation sees exactly the same cards in the same seats.
+    Returns {bot name: chips won or lost}.
+    """
+    names = list(bots)
+    seating = names[rotation:] + names[:rotation]
+    game = PokerGame(seating, stack, verbose=False, rng=random.Random(deal_seed))
+    game.policies = dict(bots)
+    game.dealer = len(seating) - 1 #start_new_hand moves the button on to seat 0
+
+    adjuster = None
+    if luck_correction:
+        adjuster = AllInLuckAdjuster(samples, random.Random(deal_seed))
+        game.listeners.append(adjuster)
+
+    game.play_hand(small_blind, big_blind)
+
+    if adjuster is not None and adjuster.adjusted is not None:
+        return {name: chips - stack for name, chips in adjuster.adjusted.items()}
+    return {p.name: p.chips - stack for p in game.players}
+
+
+def play_deals(bots, deal_seeds, small_blind, big_blind, stack, luck_correction, samples):
+    """Duplicate score of every bot for each deal: its result averaged over all seat rotations"""
+    scores = []
+    for deal_seed in deal_seeds:
+        totals = {name: 0.0 for name in bots}
+        for rotation in range(len(bots)):
+            for name, delta in play_deal(bots, deal_seed, rotation, small_blind, big_blind,
+                                         stack, luck_correction, samples).items():
+                totals[name] += delta
+        scores.append({name: total / len(bots) for name, total in totals.items()})
+    return scores
+
+
+def _play_deals_job(args):
+    return play_deals(*args)
+
+
+def duplicate_match(bots, num_deals, seed=0, small_blind=5, big_blind=10, stack=1000,
+                    luck_correction=False, samples=200, workers=1):
+    """
+    Duplicate-poker comparison of bots, headless.
+    bots: {name: policy}, policies as in PokerGame.policies (module-level functions so workers can pickle them)
+    Every deal is replayed once per seat rotation, so each bot holds every hand from every seat and
+    card luck cancels out. luck_correction also applies AllInLuckAdjuster to each hand.
+    Returns {name: {"bb_per_100", "std_error", "deals"}}, with std_error also in bb/100.
+    """
+    rng = random.Random(seed)
+    deal_seeds = [rng.getrandbits(64) for _ in range(num_deals)] #the whole deck sequence, fixed up front
+
+    if workers > 1:
+        chunk = -(-num_deals // workers)
+        jobs = [(bots, deal_seeds[i:i + chunk], small_blind, big_blind, stack, luck_correction, samples)
+                for i in range(0, num_deals, chunk)]
+        with Pool(workers) as pool:
+            scores = [s for part in pool.map(_play_deals_job, jobs) for s in part]
+    else:
+        scores = play_deals(bots, deal_seeds, small_blind, big_blind, stack, luck_correction, samples)
+
+    results = {}
+    for name in bots:
+        values = [s[name] / big_blind * 100 for s in scores] #per deal, in bb/100
+        mean = sum(values) / len(values)
+        variance = sum((v - mean) ** 2 for v in values) / (len(values) - 1) if len(values) > 1 else 0.0
+        results[name] = {
+            "bb_per_100": mean,
+            "std_error": math.sqrt(variance / len(values)),
+            "deals": len(values),
+        }
+    return results
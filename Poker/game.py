@@ -1,12 +1,25 @@
 from deck import Deck
 from player import Player
 
+
+def check_or_call(game, actor_index, actions):
+    """Default policy: if CHECK is allowed, do it; else CALL (never raises or folds)"""
+    for a in actions:
+        if a[0] == "CHECK":
+            return ("CHECK", 0)
+    # facing a bet: call (amount is returned by legal_actions)
+    call_amt = next((amt for (k, amt, *_) in actions if k == "CALL"), 0)
+    return ("CALL", call_amt)
+
+
 class PokerGame:
-    def __init__(self, player_names, starting_chips=1000):
+    def __init__(self, player_names, starting_chips=1000, verbose=True, rng=None):
         """Initializes list of players, deck which is shuffled, community cards list as empty, dealer position as 0, pot as 0"""
         self.players = [Player(name, starting_chips) for name in player_names]
+        self.verbose = verbose #False runs headless, with no hand log
+        self.rng = rng #random.Random used for shuffling, None uses the global random module
         self.deck = Deck()
-        self.deck.shuffle()
+        self.deck.shuffle(self.rng)
         self.community_cards = []
         self.dealer = 0
         self.pot = 0
@@ -16,6 +29,20 @@ class PokerGame:
         self.street = "preflop"
         self.small_blind_amount = 0
         self.big_blind_amount = 0
+        self.policies = {} #player name -> callable(game, actor_index, actions) returning the action to take
+        self.listeners = [] #objects notified of hand events (on_hand_start, on_street, on_action, on_showdown, on_hand_end)
+
+    def notify(self, event, *args):
+        """Forwards a game event to every listener that implements a method with that name"""
+        for listener in self.listeners:
+            handler = getattr(listener, event, None)
+            if handler is not None:
+                handler(self, *args)
+
+    def log(self, message):
+        """Prints the hand log unless the game runs headless"""
+        if self.verbose:
+            print(message)
 
     def deal_initial_hands(self):
         """Deal 2 hole cards to each player."""
@@ -84,9 +111,9 @@ class PokerGame:
         self.current_bet = big_blind
         self.last_raise_size = big_blind
 
-        print(f"{sb_player.name} posts Small Blind: {small_blind}")
-        print(f"{bb_player.name} posts Big Blind: {big_blind}")
-        print(f"Pot is now {self.live_pot()}")
+        self.log(f"{sb_player.name} posts Small Blind: {small_blind}")
+        self.log(f"{bb_player.name} posts Big Blind: {big_blind}")
+        self.log(f"Pot is now {self.live_pot()}")
 
         self.small_blind_amount = small_blind
         self.big_blind_amount = big_blind
@@ -127,7 +154,7 @@ class PokerGame:
         self.community_cards = []
 
         self.deck = Deck()
-        self.deck.shuffle()
+        self.deck.shuffle(self.rng)
 
         for player in self.players:
             player.hole_cards = []
@@ -139,6 +166,30 @@ class PokerGame:
         """resets hand + rotates the blinds + posts blinds for new round"""
         self.start_new_hand()
         self.post_blinds(small_blind, big_blind)
+        self.notify("on_hand_start")
+
+    def start_street(self, street):
+        """moves to the next street and clears the table to-level so betting starts fresh"""
+        self.street = street
+        self.current_bet = 0
+        self.last_raise_size = 0
+        self.notify("on_street", street)
+
+    def play_hand(self, small_blind, big_blind):
+        """Plays one full hand: blinds, deal, all four betting streets and showdown"""
+        self.start_round(small_blind, big_blind)
+        self.deal_initial_hands()
+        self.betting_round(self.first_to_act_preflop())
+
+        for street, deal in (("flop", self.deal_flop), ("turn", self.deal_turn), ("river", self.deal_river)):
+            if len(self.players_in_hand()) <= 1: #everyone else folded, no more cards needed
+                break
+            deal()
+            self.start_street(street)
+            if len(self.players_who_can_act()) > 1: #no betting if at most one player still has chips
+                self.betting_round(self.first_to_act_postflop())
+
+        self.showdown()
 
     def betting_round(self, starting_player_index):
         """
@@ -147,7 +198,7 @@ class PokerGame:
           - self.record_raise(target_to)
           - self.should_end_betting_round(acted_since_raise)
           - self.collect_bets()  (called at the end to slice pots)
-        Default policy for now: CHECK if possible, otherwise CALL (no raises yet).
+        Each player acts through self.policies[name], defaulting to check_or_call.
         """
         num_players = len(self.players)
         actor = starting_player_index
@@ -167,47 +218,38 @@ class PokerGame:
             # What can they legally do?
             actions = self.legal_actions(actor)
 
-            # ---------- YOUR DECISION LOGIC GOES HERE LATER ----------
-            # For now: if CHECK is allowed, do it; else CALL.
-            # (We won't RAISE yet; you'll wire it where marked below.)
-            act = None
-            for a in actions:
-                if a[0] == "CHECK":
-                    act = ("CHECK", 0)
-                    break
-            if act is None:
-                # facing a bet: call (amount is returned by legal_actions)
-                call_amt = next((amt for (k, amt, *_) in actions if k == "CALL"), 0)
-                act = ("CALL", call_amt)
+            # ---------- Decision: the player's policy, or check/call ----------
+            policy = self.policies.get(player.name, check_or_call)
+            act = policy(self, actor, actions)
             # ---------------------------------------------------------
 
+            self.notify("on_action", actor, act) #before applying, so listeners see the state the player faced
+
             # Apply the chosen action
             if act[0] == "CHECK":
                 # Legal check (your Player.check already handles legality)
                 player.check(self.current_bet)
-                print(f"{player.name} checks. (Chips Left: {player.chips})")
+                self.log(f"{player.name} checks. (Chips Left: {player.chips})")
 
             elif act[0] == "CALL":
                 to_call = max(0, self.current_bet - player.current_bet)
                 added = player.call(self.current_bet)  # uses your existing method
                 # live pot display = pots already made + current street contributions
                 live_pot = self.pot + sum(p.current_bet for p in self.players)
-                print(f"{player.name} calls {to_call}, added {added}. Pot: {self.live_pot()}")
+                self.log(f"{player.name} calls {to_call}, added {added}. Pot: {self.live_pot()}")
 
             elif act[0] == "RAISE_TO":
-                # You’ll use this branch once you start raising.
                 target_to = act[1]
                 added = player.raise_to(target_to)  # moves chips
                 reopened = self.record_raise(target_to)  # updates current_bet / last_raise_size
                 live_pot = self.pot + sum(p.current_bet for p in self.players)
-                print(f"{player.name} raises to {target_to} (added {added}). Pot: {self.live_pot()}")
+                self.log(f"{player.name} raises to {target_to} (added {added}). Pot: {self.live_pot()}")
                 if reopened:
                     acted_since_raise.clear()  # everyone must act again
-                # NOTE: remove this whole branch until you're ready to enable raises.
 
             elif act[0] == "FOLD":
                 player.fold()
-                print(f"{player.name} folds.")
+                self.log(f"{player.name} folds.")
 
             # Mark this player as having acted in the current cycle
             acted_since_raise.add(player)
@@ -223,7 +265,7 @@ class PokerGame:
         self.collect_bets()
         for p in self.players:
             p.current_bet = 0
-        print(f"--- End of Betting Round. Pot is now {self.pot} ---\n")
+        self.log(f"--- End of Betting Round. Pot is now {self.pot} ---\n")
 
     def collect_bets(self):
         while True:
@@ -258,7 +300,7 @@ class PokerGame:
         for p in self.players_in_hand():
             if p.chips > 0 and self.to_call(p) > 0:
                 return False
-            return True
+        return True
 
     def should_end_betting_round(self, acted_since_raise: set):
         remaining = self.players_in_hand()
@@ -361,13 +403,15 @@ class PokerGame:
         """checks who won, then declares result"""
 
         contenders = [p for p in self.players if not p.folded]
+        self.notify("on_showdown", contenders)
         for p in contenders:
             p.evaluate_best_hand(self.community_cards)
 
-        ranked = sorted(contenders, key=lambda pl: (pl.best_hand[0], pl.best_hand[1]), reverse=True)
-        print("\n--- SHOWDOWN ---")
-        for pl in ranked:
-            print(f"  {pl.name:7}: {pl.pretty_hand()}")
+        if self.verbose: #formatting hands is only worth it when someone reads the log
+            ranked = sorted(contenders, key=lambda pl: (pl.best_hand[0], pl.best_hand[1]), reverse=True)
+            self.log("\n--- SHOWDOWN ---")
+            for pl in ranked:
+                self.log(f"  {pl.name:7}: {pl.pretty_hand()}")
 
         if any(p.current_bet > 0 for p in self.players):
             self.collect_bets()
@@ -392,6 +436,8 @@ class PokerGame:
                 for j in range(remainder):
                     winners_by_seat[j % len(winners_by_seat)].chips += 1
 
-            print(f"Pot (i): {pot['amount']} → {', '.join(w.name for w in winners)}" f" (+{share}{' + remainder distributed' if remainder else ''})")
+            if self.verbose:
+                self.log(f"Pot (i): {pot['amount']} → {', '.join(w.name for w in winners)}" f" (+{share}{' + remainder distributed' if remainder else ''})")
         self.pots = []
         self.pot = 0
+        self.notify("on_hand_end")
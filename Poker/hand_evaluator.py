@@ -266,7 +266,7 @@ def format_hand_result(rank_value, tiebreakers):
         return RANK_NAMES.get(value, str(value))
 
     if rank_value == 8:
-        if tiebreakers[0] == 14 and tiebreakers[1] == 13: #special case for royal flush
+        if tiebreakers[0] == 14: #special case for royal flush (tiebreakers only holds the top card)
             return "Royale Flush"
         return f"Straight Flush, {name_card(tiebreakers[0])}-high"
 
@@ -0,0 +1,181 @@
+from deck import Deck
+
+# Same 0-8 scale as evaluate_hand's rank_value
+HAND_NAMES = ("High Card", "One Pair", "Two Pair", "Three of a Kind", "Straight",
+              "Flush", "Full House", "Four of a Kind", "Straight Flush")
+
+SUIT_INDEX = {'♠': 0, '♥': 1, '♦': 2, '♣': 3}
+
+# The ten 5-rank windows a straight can use, as 13-bit rank masks (bit 0 = deuce, bit 12 = ace)
+STRAIGHT_WINDOWS = [0b11111 << low for low in range(9)] + [0b1000000001111] #last one is the wheel A-2-3-4-5
+
+
+def rank_bit(card):
+    return 1 << (card.value - 2)
+
+
+def suit_masks(cards):
+    """Returns [spades, hearts, diamonds, clubs] 13-bit rank masks"""
+    masks = [0, 0, 0, 0]
+    for c in cards:
+        masks[SUIT_INDEX[c.suit]] |= rank_bit(c)
+    return masks
+
+
+def straight_high(rank_mask):
+    """
+    Highest straight in a 13-bit rank mask, as the top card value (5 for the wheel), or 0.
+    Same rule as check_straight: five consecutive ranks, with the Ace also playing low.
+    """
+    for window in reversed(STRAIGHT_WINDOWS[:9]): #highest straight first
+        if rank_mask & window == window:
+            return window.bit_length() + 1
+    if rank_mask & STRAIGHT_WINDOWS[9] == STRAIGHT_WINDOWS[9]:
+        return 5
+    return 0
+
+
+def ace_low(rank_mask):
+    """14-bit mask with the Ace on both ends: bit 0 is the low Ace, bits 1-13 are 2 to Ace"""
+    return rank_mask << 1 | rank_mask >> 12 & 1
+
+
+def hand_category(masks):
+    """Hand category (0-8, like evaluate_hand) straight from the four suit masks"""
+    s, h, d, c = masks
+    ranks = s | h | d | c
+
+    for suited in masks:
+        if suited.bit_count() >= 5 and straight_high(suited): #same check as check_straight_flush
+            return 8
+
+    if s & h & d & c:
+        return 7
+    trips = (s & h & d) | (s & h & c) | (s & d & c) | (h & d & c)
+    pairs = (s & h) | (s & d) | (s & c) | (h & d) | (h & c) | (d & c) #ranks held at least twice
+    if trips and pairs.bit_count() >= 2:
+        return 6
+    if any(suited.bit_count() >= 5 for suited in masks):
+        return 5
+    if straight_high(ranks):
+        return 4
+    if trips:
+        return 3
+    if pairs.bit_count() >= 2:
+        return 2
+    if pairs:
+        return 1
+    return 0
+
+
+def unseen_cards(known_cards):
+    """Every card of a fresh deck that isn't in known_cards (47 on the flop, 46 on the turn, fewer once opponents' cards are known)"""
+    known = {(c.rank, c.suit) for c in known_cards}
+    return [c for c in Deck().cards if (c.rank, c.suit) not in known]
+
+
+def improving_cards(hole_cards, board, cards):
+    """
+    Which of `cards` improve this hand, as {index into cards: new category}.
+    A card only counts if the hole cards play: the board plus that card alone must not reach the same category.
+    """
+    hand_masks = suit_masks(hole_cards + board)
+    board_masks = suit_masks(board)
+    current = hand_category(hand_masks)
+
+    improved = {}
+    for i, card in enumerate(cards):
+        suit, bit = SUIT_INDEX[card.suit], rank_bit(card)
+
+        hand_masks[suit] |= bit
+        new_category = hand_category(hand_masks)
+        hand_masks[suit] ^= bit
+
+        if new_category <= current:
+            continue
+
+        had_bit = board_masks[suit] & bit
+        board_masks[suit] |= bit
+        board_category = hand_category(board_masks)
+        if not had_bit:
+            board_masks[suit] ^= bit
+
+        if new_category > board_category:
+            improved[i] = new_category
+    return improved
+
+
+def classify_draws(hole_cards, board):
+    """
+    Draws the hand holds on a flop or turn board:
+    "flush_draw", "open_ended", "double_gutshot", "gutshot", and on the flop "backdoor_flush",
+    "backdoor_straight". open_ended is four ranks in a row open at both ends (98 on 7-6-K);
+    double_gutshot is two inside ranks that each make a straight (J9 on K-T-7 needs a Q or an 8).
+    Only draws that use at least one hole card are reported.
+    """
+    hole_masks = suit_masks(hole_cards)
+    masks = suit_masks(hole_cards + board)
+    ranks = masks[0] | masks[1] | masks[2] | masks[3]
+    hole_ranks = hole_masks[0] | hole_masks[1] | hole_masks[2] | hole_masks[3]
+    draws = []
+
+    if hand_category(masks) >= 5: #already a flush or better, nothing to draw to
+        return draws
+
+    if any(suited.bit_count() == 4 and hole_masks[i] for i, suited in enumerate(masks)):
+        draws.append("flush_draw")
+
+    if not straight_high(ranks):
+        completing = 0 #ranks that would make a straight with a hole card in it
+        for r in range(13):
+            bit = 1 << r
+            if ranks & bit:
+                continue
+            with_card = ranks | bit
+            if any(with_card & w == w and hole_ranks & w for w in STRAIGHT_WINDOWS):
+                completing |= bit
+        runs, ends, held = ace_low(ranks), ace_low(completing), ace_low(hole_ranks)
+        open_ended = any(runs & (0b1111 << low) == 0b1111 << low and held & (0b1111 << low)
+                         and ends >> (low - 1) & 1 and ends >> (low + 4) & 1 for low in range(1, 10))
+        if open_ended: #four in a row that either end completes
+            draws.append("open_ended")
+        elif completing.bit_count() >= 2: #same 8 outs, but two separate inside cards
+            draws.append("double_gutshot")
+        elif completing:
+            draws.append("gutshot")
+
+    if len(board) == 3:
+        if "flush_draw" not in draws and any(suited.bit_count() == 3 and hole_masks[i] for i, suited in enumerate(masks)):
+            draws.append("backdoor_flush")
+        if not any(d in draws for d in ("open_ended", "double_gutshot", "gutshot")) and not straight_high(ranks):
+            if any((ranks & w).bit_count() == 3 and hole_ranks & w for w in STRAIGHT_WINDOWS):
+                draws.append("backdoor_straight")
+
+    return draws
+
+
+def analyze_outs(players, board):
+    """
+    Outs for every player against everyone else on a flop or turn board.
+    players: Player objects with their hole_cards dealt (folded players are skipped)
+    Returns {name: {"category", "draws", "outs": [(card, new category, [opponents it also improves])]}}
+    Every unseen card is checked once per player with a single mask update, not a full evaluate_hand.
+    """
+    live = [p for p in players if not p.folded]
+    known = list(board) + [c for p in live for c in p.hole_cards]
+    unseen = unseen_cards(known)
+
+    improves = {p.name: improving_cards(p.hole_cards, board, unseen) for p in live}
+
+    result = {}
+    for p in live:
+        outs = []
+        for i, new_category in improves[p.name].items():
+            helped = [o.name for o in live if o is not p and i in improves[o.name]]
+            outs.append((unseen[i], new_category, helped))
+        result[p.name] = {
+            "category": hand_category(suit_masks(p.hole_cards + board)),
+            "draws": classify_draws(p.hole_cards, board),
+            "outs": outs,
+        }
+    return result
@@ -0,0 +1,153 @@
+import os
+
+import numpy as np
+
+from combos import CACHE_DIR, CLASS_NAMES, class_index, preflop_equity_matrix
+
+
+def solve_push_fold(stack_bb, num_players=2, small_blind=0.5, iterations=300, equity=None, weights=None):
+    """
+    Shove/call equilibrium at one stack depth (in big blinds, everyone equally deep), by fictitious play:
+    each iteration every seat best-responds to the others' average strategy over the 169x169 matrix.
+    Positions are in action order, the last two being SB and BB (heads-up: 0 = SB, 1 = BB).
+    Multiway pots are approximated with the usual single-caller model: once someone calls the shove,
+    the players behind fold.
+    Returns (shove, call): shove[k] is the first-in shove frequency per class for position k, and
+    call[k, m] the frequency position m calls a shove from k.
+    """
+    if equity is None or weights is None:
+        equity, weights = preflop_equity_matrix()
+    n = num_players
+    blinds = np.zeros(n)
+    blinds[n - 2] = small_blind
+    blinds[n - 1] = 1.0
+    total_blinds = blinds.sum()
+    stack = max(stack_bb, 1.0) #a stack smaller than the big blind is all-in anyway
+
+    weighted_equity = weights * equity
+    weight_sums = weights.sum(axis=1)
+
+    shove = np.ones((n - 1, 169)) #average strategies, start from "always"
+    call = np.zeros((n - 1, n, 169))
+    for k in range(n - 1):
+        call[k, k + 1:] = 1.0
+
+    for t in range(iterations):
+        rate = 1.0 / (t + 2)
+        best_shove = np.zeros_like(shove)
+        best_call = np.zeros_like(call)
+
+        for k in range(n - 1):
+            # Shover k with each hand: walk the players behind, the first caller takes the pot on
+            reach = np.ones(169) #chance nobody in between called
+            ev = np.zeros(169)
+            for m in range(k + 1, n):
+                calls = weights @ call[k, m]
+                p_call = calls / weight_sums
+                eq = np.divide(weighted_equity @ call[k, m], calls, out=np.full(169, 0.5), where=calls > 0)
+                dead = total_blinds - blinds[k] - blinds[m]
+                ev += reach * p_call * (eq * (2 * stack + dead) - stack)
+                reach *= 1 - p_call
+            ev += reach * (total_blinds - blinds[k])
+            best_shove[k] = ev > -blinds[k]
+
+            # Callers facing k's shove range
+            shoves = weights @ shove[k]
+            eq = np.divide(weighted_equity @ shove[k], shoves, out=np.full(169, 0.5), where=shoves > 0)
+            for m in range(k + 1, n):
+                dead = total_blinds - blinds[k] - blinds[m]
+                best_call[k, m] = eq * (2 * stack + dead) - stack > -blinds[m]
+
+        shove += rate * (best_shove - shove)
+        call += rate * (best_call - call)
+
+    return shove, call
+
+
+class PushFoldChart:
+    def __init__(self, num_players=2, small_blind=0.5, big_blind=1.0, depths=None, iterations=300,
+                 boards=1000, seed=0, cache_dir=CACHE_DIR):
+        """
+        Push/fold equilibrium for every stack depth in `depths` (big blinds, default 1-25 in half steps).
+        The blind structure only matters through small_blind / big_blind. boards and seed pick the
+        preflop_equity_matrix the chart is solved on. Charts are cached on disk and only reused when
+        depths, iterations, boards and seed all match.
+        """
+        self.num_players = num_players
+        self.sb_ratio = small_blind / big_blind
+        self.depths = np.arange(1.0, 25.5, 0.5) if depths is None else np.asarray(depths, dtype=float)
+
+        path = os.path.join(cache_dir, f"pushfold_{num_players}p_sb{self.sb_ratio:.3f}.npz")
+        if os.path.exists(path):
+            cached = np.load(path)
+            settings = {"iterations": iterations, "boards": boards, "seed": seed}
+            if np.array_equal(cached["depths"], self.depths) and all(
+                    k in cached and int(cached[k]) == v for k, v in settings.items()): #older charts lack settings
+                self.shove, self.call = cached["shove"], cached["call"]
+                return
+
+        equity, weights = preflop_equity_matrix(boards, seed, cache_dir)
+        solved = [solve_push_fold(d, num_players, self.sb_ratio, iterations, equity, weights) for d in self.depths]
+        self.shove = np.array([s for s, _ in solved]) #(depths, positions, 169)
+        self.call = np.array([c for _, c in solved]) #(depths, shover, caller, 169)
+
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(path, depths=self.depths, iterations=iterations, boards=boards, seed=seed,
+                 shove=self.shove, call=self.call)
+
+    @classmethod
+    def for_game(cls, game, **kwargs):
+        """Chart for the blinds set by game.post_blinds and the number of players with chips"""
+        num_players = sum(1 for p in game.players if p.chips + p.current_bet > 0)
+        return cls(num_players, game.small_blind_amount, game.big_blind_amount, **kwargs)
+
+    def depth_index(self, stack_bb):
+        i = int(np.searchsorted(self.depths, stack_bb))
+        if i == len(self.depths):
+            return i - 1
+        if i > 0 and stack_bb - self.depths[i - 1] < self.depths[i] - stack_bb:
+            return i - 1
+        return i
+
+    def shove_range(self, position, stack_bb, min_frequency=0.5):
+        """{class name: frequency} of hands position `position` shoves first in"""
+        row = self.shove[self.depth_index(stack_bb), position]
+        return {CLASS_NAMES[i]: float(f) for i, f in enumerate(row) if f >= min_frequency}
+
+    def call_range(self, shover, caller, stack_bb, min_frequency=0.5):
+        """{class name: frequency} of hands `caller` calls a shove from `shover` with"""
+        row = self.call[self.depth_index(stack_bb), shover, caller]
+        return {CLASS_NAMES[i]: float(f) for i, f in enumerate(row) if f >= min_frequency}
+
+    def position(self, game, seat):
+        """Chart position of a table seat: UTG = 0 ... SB = n - 2, BB = n - 1"""
+        return (seat - game.big_blind_pos - 1) % len(game.players)
+
+    def effective_stack_bb(self, game, seat):
+        me = game.players[seat]
+        others = [p.chips + p.current_bet for p in game.players if p is not me and not p.folded]
+        return min(me.chips + me.current_bet, max(others, default=0)) / game.big_blind_amount
+
+    def policy(self, game, actor_index, actions):
+        """Use as game.policies[name]: preflop it shoves or calls a shove by the chart, later streets check/call"""
+        player = game.players[actor_index]
+        kinds = {a[0]: a for a in actions}
+        passive = ("CHECK", 0) if "CHECK" in kinds else ("FOLD", 0)
+        if game.street != "preflop" or len(game.players) != self.num_players:
+            return ("CHECK", 0) if "CHECK" in kinds else ("CALL", kinds["CALL"][1])
+
+        hand = class_index(*player.hole_cards)
+        depth = self.depth_index(self.effective_stack_bb(game, actor_index))
+        me = self.position(game, actor_index)
+
+        if game.current_bet <= game.big_blind_amount: #unopened
+            if me == self.num_players - 1: #BB walked to, take the check
+                return passive
+            if self.shove[depth, me, hand] >= 0.5 and "RAISE_TO" in kinds:
+                return ("RAISE_TO", player.current_bet + player.chips)
+            return passive
+
+        shover = max(range(len(game.players)), key=lambda s: game.players[s].current_bet)
+        if self.call[depth, self.position(game, shover), me, hand] >= 0.5:
+            return ("CALL", kinds["CALL"][1])
+        return passive
@@ -0,0 +1,167 @@
+import re
+
+import numpy as np
+
+from combos import (CARD_INDEX, COMBO_CARDS, COMBO_CLASS, COMBO_INDEX, RANKS, CLASS_COMBOS,
+                    preflop_ranking, rank_name)
+
+RANK_CHARS = [rank_name(r) for r in RANKS] #"A", "K", ..., "T", ..., "2"
+SUITS = {'s': '♠', 'h': '♥', 'd': '♦', 'c': '♣', '♠': '♠', '♥': '♥', '♦': '♦', '♣': '♣'}
+
+# (1326,) combos of each of the 169 classes
+CLASS_TO_COMBOS = [np.flatnonzero(COMBO_CLASS == c) for c in range(169)]
+
+CARD_RE = re.compile(r"([AKQJT98765432]|10)([shdc♠♥♦♣])")
+CARDS_RE = re.compile(r"(?:(?:[AKQJT98765432]|10)[shdc♠♥♦♣])*")
+COMBO_RE = re.compile(r"^([AKQJT98765432][shdc♠♥♦♣])([AKQJT98765432][shdc♠♥♦♣])$")
+CLASS_RE = re.compile(r"^([AKQJT98765432])([AKQJT98765432])([so]?)(\+?)$")
+PERCENT_RE = re.compile(r"^(?:top\s*)?(\d+(?:\.\d+)?)%$")
+
+
+def parse_cards(text):
+    """
+    Card indices (see combos.CARDS) from text like "Ks9d4c" or "K♠ 9♦ 4♣".
+    Raises ValueError unless the whole text is cards, or when a card repeats.
+    """
+    compact = text.replace(" ", "")
+    if not CARDS_RE.fullmatch(compact):
+        raise ValueError(f"Can't parse cards '{text}'")
+    cards = []
+    for rank, suit in CARD_RE.findall(compact):
+        rank = '10' if rank == 'T' else rank
+        cards.append(CARD_INDEX[(rank, SUITS[suit])])
+    if len(set(cards)) != len(cards):
+        raise ValueError(f"Duplicate card in '{text}'")
+    return cards
+
+
+def parse_board(board):
+    """Board card indices from text or indices, with at most 5 distinct cards"""
+    cards = parse_cards(board) if isinstance(board, str) else [int(c) for c in board]
+    if any(not 0 <= c < 52 for c in cards) or len(set(cards)) != len(cards):
+        raise ValueError(f"Invalid board {board!r}")
+    if len(cards) > 5:
+        raise ValueError(f"A board has at most 5 cards, got {len(cards)}")
+    return cards
+
+
+def rank_pos(char):
+    """0 for Ace ... 12 for deuce"""
+    return RANK_CHARS.index(char)
+
+
+def class_of(high, low, suitedness):
+    """Class indices for ranks given as chart positions; suitedness "" means both suited and offsuit"""
+    if high == low:
+        return [high * 13 + high]
+    hi, lo = min(high, low), max(high, low)
+    classes = []
+    if suitedness in ("s", ""):
+        classes.append(hi * 13 + lo)
+    if suitedness in ("o", ""):
+        classes.append(lo * 13 + hi)
+    return classes
+
+
+def expand_class_token(token):
+    """Class indices for "AKs", "AK", "77", "77+", "A2s+", "KTo+" """
+    m = CLASS_RE.match(token)
+    if m is None:
+        raise ValueError(f"Can't parse range token '{token}'")
+    first, second, suitedness, plus = rank_pos(m.group(1)), rank_pos(m.group(2)), m.group(3), m.group(4)
+
+    if first == second:
+        if suitedness:
+            raise ValueError(f"Pairs can't be suited or offsuit: '{token}'")
+        pairs = range(0, first + 1) if plus else [first] #77+ is 77 up to AA
+        return [p * 13 + p for p in pairs]
+
+    high, low = min(first, second), max(first, second)
+    if not plus:
+        return class_of(high, low, suitedness)
+    classes = [] #A2s+ is A2s up to AKs: the kicker climbs to one below the top card
+    for kicker in range(low, high, -1):
+        classes += class_of(high, kicker, suitedness)
+    return classes
+
+
+def expand_dash_token(token):
+    """Class indices for "22-55" or "A2s-A5s" """
+    start, end = (part.strip() for part in token.split("-"))
+    a, b = CLASS_RE.match(start), CLASS_RE.match(end)
+    if a is None or b is None or a.group(3) != b.group(3) or a.group(4) or b.group(4):
+        raise ValueError(f"Can't parse range token '{token}'")
+
+    a1, a2, b1, b2 = (rank_pos(a.group(1)), rank_pos(a.group(2)), rank_pos(b.group(1)), rank_pos(b.group(2)))
+    if a1 == a2 and b1 == b2: #pair run
+        return [p * 13 + p for p in range(min(a1, b1), max(a1, b1) + 1)]
+    if a1 != b1:
+        raise ValueError(f"Dash ranges need the same top card: '{token}'")
+    return [c for kicker in range(min(a2, b2), max(a2, b2) + 1) for c in class_of(a1, kicker, a.group(3))]
+
+
+def top_percent(percent):
+    """
+    (1326,) weights for the strongest `percent` of all combos; the boundary class is partly included.
+    Uses combos.preflop_ranking, whose equity matrix takes a few seconds to build on a cold cache.
+    """
+    weights = np.zeros(len(COMBO_CARDS))
+    target = len(COMBO_CARDS) * percent / 100.0
+    taken = 0.0
+    for c in preflop_ranking():
+        if taken >= target:
+            break
+        fraction = min(1.0, (target - taken) / CLASS_COMBOS[c])
+        weights[CLASS_TO_COMBOS[c]] = fraction
+        taken += CLASS_COMBOS[c] * fraction
+    return weights
+
+
+def parse_range(text, board=None):
+    """
+    Parses a hand range into (1326,) combo weights in [0, 1], ordered like combos.COMBOS.
+    Tokens are comma separated:
+      AA, AKs, AKo, AK        single classes (AK = suited and offsuit)
+      77+, A2s+, KTo+         pairs upwards / kicker up to one below the top card
+      22-55, A2s-A5s          runs
+      AsKh                    one specific combo
+      12%, top 12%            strongest 12% of combos by equity against a random hand
+    Any token can take a weight, e.g. "AKs:0.5". Combos that share a card with `board` get weight 0.
+    The first percentage token on a cold cache builds the preflop equity matrix (a few seconds).
+    """
+    weights = np.zeros(len(COMBO_CARDS))
+    for raw in text.split(","):
+        token = raw.strip()
+        if not token:
+            continue
+        weight = 1.0
+        if ":" in token:
+            token, weight_text = (part.strip() for part in token.rsplit(":", 1))
+            weight = float(weight_text)
+            if not 0.0 <= weight <= 1.0:
+                raise ValueError(f"Weight must be between 0 and 1: '{raw.strip()}'")
+
+        percent = PERCENT_RE.match(token.lower())
+        specific = COMBO_RE.match(token)
+        if percent:
+            top = top_percent(float(percent.group(1)))
+            chosen = np.flatnonzero(top)
+            weights[chosen] = top[chosen] * weight
+            continue
+        if specific:
+            try:
+                a, b = parse_cards(token)
+            except ValueError: #the same card twice, like "AsAs"
+                raise ValueError(f"Can't parse range token '{token}'") from None
+            weights[COMBO_INDEX[(min(a, b), max(a, b))]] = weight
+            continue
+
+        classes = expand_dash_token(token) if "-" in token else expand_class_token(token)
+        for c in classes:
+            weights[CLASS_TO_COMBOS[c]] = weight
+
+    if board:
+        board = parse_board(board)
+        blocked = np.isin(COMBO_CARDS, board).any(axis=1)
+        weights[blocked] = 0.0
+    return weights
@@ -0,0 +1,209 @@
+import glob
+import os
+import random
+from bisect import bisect_right
+from multiprocessing import Pool
+
+import numpy as np
+
+from combos import card_index
+from game import PokerGame
+
+MAX_SEATS = 9
+STREETS = ("preflop", "flop", "turn", "river")
+# Legal-action mask slots, filled from PokerGame.legal_actions
+LEGAL_SLOTS = ("FOLD", "CHECK", "CALL", "MIN_RAISE", "ALL_IN")
+
+# Feature vector layout: (name, width), laid out back to back
+FEATURE_LAYOUT = (
+    ("hole_cards", 52),       #one-hot over combos.CARDS
+    ("board", 52),
+    ("street", len(STREETS)),
+    ("position", MAX_SEATS),  #seats after the button, one-hot
+    ("stacks", MAX_SEATS),    #chips behind in big blinds, actor first then clockwise
+    ("pot", 1),               #live pot in big blinds
+    ("to_call", 1),           #in big blinds
+    ("legal", len(LEGAL_SLOTS)),
+)
+FEATURE_OFFSETS = {}
+_offset = 0
+for _name, _width in FEATURE_LAYOUT:
+    FEATURE_OFFSETS[_name] = _offset
+    _offset += _width
+FEATURE_WIDTH = _offset
+
+
+class RandomPolicy:
+    def __init__(self, seed=None, raise_probability=0.2):
+        """Self-play policy: a uniformly random legal action, raising only some of the time so hands end"""
+        self.rng = random.Random(seed)
+        self.raise_probability = raise_probability
+
+    def __call__(self, game, actor_index, actions):
+        raises = [a for a in actions if a[0] == "RAISE_TO"]
+        others = [a for a in actions if a[0] != "RAISE_TO"]
+        if raises and (not others or self.rng.random() < self.raise_probability):
+            return self.rng.choice(raises)[:2]
+        return self.rng.choice(others)[:2]
+
+
+class SampleRecorder:
+    def __init__(self, out_dir, shard_size=100_000, prefix="shard"):
+        """
+        Game listener that writes one fixed-width feature row per decision straight into preallocated
+        NumPy buffers, fills in the outcome once the hand ends and flushes full buffers as .npy shards.
+        Memory stays at shard_size rows whatever the number of hands played.
+        """
+        self.out_dir = out_dir
+        self.shard_size = shard_size
+        self.prefix = prefix
+        os.makedirs(out_dir, exist_ok=True)
+
+        self.features = np.zeros((shard_size, FEATURE_WIDTH), dtype=np.float32)
+        self.actions = np.zeros(shard_size, dtype=np.int8) #index into LEGAL_SLOTS of the action taken
+        self.seats = np.zeros(shard_size, dtype=np.int8) #seat of the actor, to attach the outcome
+        self.outcomes = np.zeros(shard_size, dtype=np.float32) #actor's chips won/lost in the hand, in big blinds
+        self.rows = 0
+        self.hand_start_row = 0 #rows from here on belong to the hand in progress
+        self.shards_written = 0
+        self.samples_written = 0
+
+    def on_hand_start(self, game):
+        self.hand_start_row = self.rows
+        self.start_chips = [p.chips + p.current_bet for p in game.players] #blinds are already posted
+
+    def on_action(self, game, actor_index, act):
+        if self.rows == self.shard_size:
+            self.flush()
+            if self.rows == self.shard_size: #one hand filled the whole buffer, no outcome to wait for
+                raise ValueError("shard_size is smaller than the number of decisions in a single hand")
+
+        row = self.features[self.rows]
+        row[:] = 0
+        player = game.players[actor_index]
+        bb = game.big_blind_amount or 1
+        n = len(game.players)
+
+        for c in player.hole_cards:
+            row[FEATURE_OFFSETS["hole_cards"] + card_index(c)] = 1
+        for c in game.community_cards:
+            row[FEATURE_OFFSETS["board"] + card_index(c)] = 1
+        row[FEATURE_OFFSETS["street"] + STREETS.index(game.street)] = 1
+        row[FEATURE_OFFSETS["position"] + (actor_index - game.dealer) % n] = 1
+        for k in range(min(n, MAX_SEATS)):
+            row[FEATURE_OFFSETS["stacks"] + k] = game.players[(actor_index + k) % n].chips / bb
+        row[FEATURE_OFFSETS["pot"]] = game.live_pot() / bb
+        row[FEATURE_OFFSETS["to_call"]] = game.to_call(player) / bb
+
+        max_to = player.current_bet + player.chips
+        for a in game.legal_actions(actor_index):
+            row[FEATURE_OFFSETS["legal"] + self.slot(a, max_to)] = 1
+
+        self.actions[self.rows] = self.slot(act, max_to)
+        self.seats[self.rows] = actor_index
+        self.rows += 1
+
+    def slot(self, act, max_to):
+        if act[0] == "RAISE_TO":
+            return LEGAL_SLOTS.index("ALL_IN" if act[1] >= max_to else "MIN_RAISE")
+        return LEGAL_SLOTS.index(act[0])
+
+    def on_hand_end(self, game):
+        bb = game.big_blind_amount or 1
+        for r in range(self.hand_start_row, self.rows):
+            seat = self.seats[r]
+            self.outcomes[r] = (game.players[seat].chips - self.start_chips[seat]) / bb
+        self.hand_start_row = self.rows
+
+    def flush(self):
+        """Writes every finished-hand row as one shard and keeps the hand in progress at the front"""
+        done = self.hand_start_row
+        if done > 0:
+            base = os.path.join(self.out_dir, f"{self.prefix}_{self.shards_written:05d}")
+            for name, array in (("features", self.features), ("actions", self.actions), ("outcomes", self.outcomes)):
+                tmp_path = f"{base}_{name}.tmp.npy"
+                np.save(tmp_path, array[:done])
+                os.replace(tmp_path, f"{base}_{name}.npy") #the loader never sees half-written shards
+            self.shards_written += 1
+            self.samples_written += done
+
+        pending = self.rows - done
+        for array in (self.features, self.actions, self.seats, self.outcomes):
+            array[:pending] = array[done:self.rows]
+        self.rows = pending
+        self.hand_start_row = 0
+
+
+def generate(out_dir, num_hands, worker=0, seed=0, num_players=6, stack=100, small_blind=1, big_blind=2,
+             shard_size=100_000):
+    """Plays num_hands headless self-play hands (stacks reset every hand) and writes their samples"""
+    if num_players > MAX_SEATS:
+        raise ValueError(f"At most {MAX_SEATS} players fit the feature layout")
+    rng = random.Random(seed)
+    names = [f"P{i}" for i in range(num_players)]
+    game = PokerGame(names, stack, verbose=False, rng=random.Random(rng.getrandbits(64)))
+    game.policies = {name: RandomPolicy(rng.getrandbits(64)) for name in names}
+    recorder = SampleRecorder(out_dir, shard_size, prefix=f"w{worker:03d}")
+    game.listeners.append(recorder)
+
+    try:
+        for _ in range(num_hands):
+            for p in game.players:
+                p.chips = stack
+            game.play_hand(small_blind, big_blind)
+    finally:
+        recorder.flush() #a failing hand still keeps every finished hand already buffered
+    return recorder.samples_written
+
+
+def _generate_job(kwargs):
+    return generate(**kwargs)
+
+
+def generate_parallel(out_dir, num_hands, workers=4, seed=0, **kwargs):
+    """Splits num_hands across worker processes, each with its own seed and shard prefix"""
+    per_worker = -(-num_hands // workers)
+    jobs = [dict(out_dir=out_dir, num_hands=min(per_worker, num_hands - w * per_worker), worker=w,
+                 seed=seed * 1_000_003 + w, **kwargs)
+            for w in range(workers) if w * per_worker < num_hands]
+    with Pool(len(jobs)) as pool:
+        return sum(pool.map(_generate_job, jobs))
+
+
+class ShardDataset:
+    def __init__(self, directory):
+        """Memory-maps every shard in `directory`; samples are read from disk only when indexed"""
+        self.shards = []
+        for path in sorted(glob.glob(os.path.join(directory, "*_features.npy"))):
+            base = path[:-len("_features.npy")]
+            self.shards.append((
+                np.load(path, mmap_mode="r"),
+                np.load(f"{base}_actions.npy", mmap_mode="r"),
+                np.load(f"{base}_outcomes.npy", mmap_mode="r"),
+            ))
+        self.ends = np.cumsum([len(s[0]) for s in self.shards]).tolist() #global index one past each shard
+
+    def __len__(self):
+        return self.ends[-1] if self.ends else 0
+
+    def __getitem__(self, index):
+        """(features, action, outcome) of one sample"""
+        if index < 0:
+            index += len(self)
+        shard = bisect_right(self.ends, index)
+        if shard == len(self.shards):
+            raise IndexError(index)
+        local = index - (self.ends[shard - 1] if shard else 0)
+        features, actions, outcomes = self.shards[shard]
+        return features[local], actions[local], outcomes[local]
+
+    def batches(self, batch_size, shuffle=True, seed=None):
+        """Yields (features, actions, outcomes) batches, shuffling shard order and rows within each shard"""
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(self.shards)) if shuffle else range(len(self.shards))
+        for s in order:
+            features, actions, outcomes = self.shards[s]
+            rows = rng.permutation(len(features)) if shuffle else np.arange(len(features))
+            for start in range(0, len(rows), batch_size):
+                pick = np.sort(rows[start:start + batch_size]) #sorted reads are kinder to the page cache
+                yield np.asarray(features[pick]), np.asarray(actions[pick]), np.asarray(outcomes[pick])
@@ -0,0 +1,263 @@
+import json
+import os
+import time
+from array import array
+from collections import deque
+
+# One slot per counter in every player's array, so updates are plain index increments
+COUNTERS = (
+    "hands",             #hands dealt in
+    "vpip",              #voluntarily put chips in preflop
+    "pfr",               #raised preflop
+    "three_bet_opp",     #faced exactly one preflop raise
+    "three_bet",         #re-raised that raise
+    "cbet_opp",          #preflop aggressor with the flop checked to them
+    "cbet",              #bet the flop as preflop aggressor
+    "fold_to_cbet_opp",  #faced a continuation bet
+    "fold_to_cbet",      #folded to it
+    "saw_flop",
+    "wtsd",              #saw the flop and went to showdown
+    "aggressive",        #postflop bets + raises
+    "passive",           #postflop calls
+)
+(HANDS, VPIP, PFR, THREE_BET_OPP, THREE_BET, CBET_OPP, CBET,
+ FOLD_TO_CBET_OPP, FOLD_TO_CBET, SAW_FLOP, WTSD, AGGRESSIVE, PASSIVE) = range(len(COUNTERS))
+
+
+def new_counters():
+    return array('q', bytes(8 * len(COUNTERS))) #zeroed int64 slots
+
+
+def add_counters(target, source, sign=1):
+    for i in range(len(COUNTERS)):
+        target[i] += sign * source[i]
+
+
+class StatsTracker:
+    def __init__(self, window_hands=None, window_seconds=None, bucket_hands=1000, bucket_seconds=60.0):
+        """
+        HUD statistics per player name, fed by PokerGame events (add it to game.listeners).
+        With no window the totals are all-time. With window_hands or window_seconds the totals
+        only cover the last window, kept as buckets of bucket_hands hands / bucket_seconds seconds
+        so that expiring old data is a subtraction of one bucket instead of a replay.
+        The window must be a whole number of buckets. It holds the full buckets before the current
+        one plus the current one so far, so a hand window covers between window_hands - bucket_hands + 1
+        and window_hands hands (a time window between window_seconds - bucket_seconds and window_seconds).
+        """
+        if window_hands is not None and window_seconds is not None:
+            raise ValueError("Use either a hand window or a time window, not both")
+        if window_hands is not None and (window_hands < bucket_hands or window_hands % bucket_hands):
+            raise ValueError(f"window_hands ({window_hands}) must be a multiple of bucket_hands ({bucket_hands})")
+        if window_seconds is not None:
+            ratio = window_seconds / bucket_seconds
+            if ratio < 1 or abs(ratio - round(ratio)) > 1e-9:
+                raise ValueError(f"window_seconds ({window_seconds}) must be a multiple of bucket_seconds ({bucket_seconds})")
+        self.window_hands = window_hands
+        self.window_seconds = window_seconds
+        self.bucket_hands = bucket_hands
+        self.bucket_seconds = bucket_seconds
+
+        self.totals = {} #name -> counters over the whole window
+        self.buckets = deque() #(bucket key, {name: counters}) oldest first
+        self.hands_seen = 0
+        self.hand_clock = 0 #hands counted for hand-window bucket keys (workers' clocks line up on merge)
+        self.hand = None #name -> counters for the hand in progress
+
+    # ---------- game listener ----------
+
+    def on_hand_start(self, game):
+        if self.hand is not None: #previous hand never reached showdown
+            self.commit_hand()
+        self.hand = {}
+        for p in game.players:
+            counters = new_counters()
+            counters[HANDS] = 1
+            self.hand[p.name] = counters
+        self.street = "preflop"
+        self.raises = 0 #bets/raises so far on this street (blinds don't count)
+        self.aggressor = None #last preflop raiser
+        self.cbet_live = False #a flop cbet is the bet currently being faced
+
+    def on_street(self, game, street):
+        if self.hand is None:
+            return
+        self.street = street
+        self.raises = 0
+        self.cbet_live = False
+        if street == "flop":
+            for p in game.players_in_hand():
+                self.hand[p.name][SAW_FLOP] = 1
+
+    def on_action(self, game, actor_index, act):
+        if self.hand is None:
+            return
+        kind = act[0]
+        name = game.players[actor_index].name
+        counters = self.hand[name]
+
+        if self.street == "preflop":
+            if self.raises == 1:
+                counters[THREE_BET_OPP] = 1
+            if kind == "CALL" or kind == "RAISE_TO":
+                counters[VPIP] = 1
+            if kind == "RAISE_TO":
+                counters[PFR] = 1
+                if self.raises == 1:
+                    counters[THREE_BET] = 1
+                self.raises += 1
+                self.aggressor = name
+            return
+
+        if self.street == "flop":
+            if self.cbet_live and kind != "CHECK":
+                counters[FOLD_TO_CBET_OPP] = 1
+                if kind == "FOLD":
+                    counters[FOLD_TO_CBET] = 1
+            if name == self.aggressor and self.raises == 0:
+                counters[CBET_OPP] = 1
+                if kind == "RAISE_TO":
+                    counters[CBET] = 1
+                    self.cbet_live = True
+            elif kind == "RAISE_TO":
+                self.cbet_live = False #a raise over the cbet, later folds are not to the cbet
+
+        if kind == "RAISE_TO":
+            counters[AGGRESSIVE] += 1
+            self.raises += 1
+        elif kind == "CALL":
+            counters[PASSIVE] += 1
+
+    def on_showdown(self, game, contenders):
+        if self.hand is None or len(contenders) < 2: #a lone survivor didn't really go to showdown
+            return
+        for p in contenders:
+            counters = self.hand[p.name]
+            if counters[SAW_FLOP]:
+                counters[WTSD] = 1
+
+    def on_hand_end(self, game):
+        if self.hand is not None:
+            self.commit_hand()
+
+    # ---------- aggregation ----------
+
+    def commit_hand(self):
+        """Folds the finished hand into the totals (and the current bucket when windowed)"""
+        self.hands_seen += 1
+        self.hand_clock += 1
+        bucket = self.current_bucket()
+        for name, counters in self.hand.items():
+            add_counters(self.totals.setdefault(name, new_counters()), counters)
+            if bucket is not None:
+                add_counters(bucket.setdefault(name, new_counters()), counters)
+        self.hand = None
+        self.expire()
+
+    def bucket_key(self):
+        if self.window_seconds is not None:
+            return int(time.time() // self.bucket_seconds)
+        return max(self.hand_clock - 1, 0) // self.bucket_hands #hands 1..bucket_hands are bucket 0
+
+    def window_buckets(self):
+        """How many bucket keys the window spans"""
+        if self.window_seconds is not None:
+            return round(self.window_seconds / self.bucket_seconds)
+        return self.window_hands // self.bucket_hands
+
+    def current_bucket(self):
+        if self.window_hands is None and self.window_seconds is None:
+            return None
+        key = self.bucket_key()
+        if not self.buckets or self.buckets[-1][0] != key:
+            self.buckets.append((key, {}))
+        return self.buckets[-1][1]
+
+    def expire(self):
+        """Drops buckets that slid out of the window and subtracts them from the totals"""
+        if not self.buckets:
+            return
+        oldest_kept = self.bucket_key() - self.window_buckets() + 1
+        while self.buckets and self.buckets[0][0] < oldest_kept:
+            _, bucket = self.buckets.popleft()
+            for name, counters in bucket.items():
+                add_counters(self.totals[name], counters, sign=-1)
+
+    def merge(self, other):
+        """Adds another tracker's counts (e.g. from a parallel worker) into this one"""
+        for name, counters in other.totals.items():
+            add_counters(self.totals.setdefault(name, new_counters()), counters)
+
+        merged = {key: bucket for key, bucket in self.buckets}
+        for key, bucket in other.buckets:
+            target = merged.setdefault(key, {})
+            for name, counters in bucket.items():
+                add_counters(target.setdefault(name, new_counters()), counters)
+        self.buckets = deque(sorted(merged.items()))
+
+        self.hands_seen += other.hands_seen
+        self.hand_clock = max(self.hand_clock, other.hand_clock) #parallel streams cover the same stretch of hands
+        self.expire()
+        return self
+
+    # ---------- reporting ----------
+
+    def counters(self, name):
+        """Raw counters for a player as {counter name: value}"""
+        counters = self.totals.get(name, new_counters())
+        return dict(zip(COUNTERS, counters))
+
+    def summary(self, name):
+        """HUD numbers for a player; percentages are 0-100, None when there is no sample yet"""
+        c = self.totals.get(name, new_counters())
+
+        def pct(hits, chances):
+            return 100.0 * hits / chances if chances else None
+
+        return {
+            "hands": c[HANDS],
+            "vpip": pct(c[VPIP], c[HANDS]),
+            "pfr": pct(c[PFR], c[HANDS]),
+            "three_bet": pct(c[THREE_BET], c[THREE_BET_OPP]),
+            "cbet": pct(c[CBET], c[CBET_OPP]),
+            "fold_to_cbet": pct(c[FOLD_TO_CBET], c[FOLD_TO_CBET_OPP]),
+            "wtsd": pct(c[WTSD], c[SAW_FLOP]),
+            "af": c[AGGRESSIVE] / c[PASSIVE] if c[PASSIVE] else None,
+        }
+
+    # ---------- persistence ----------
+
+    def save(self, path):
+        """Writes a snapshot to disk; goes through a temp file so a crash never leaves half a snapshot"""
+        snapshot = {
+            "counters": COUNTERS,
+            "window_hands": self.window_hands,
+            "window_seconds": self.window_seconds,
+            "bucket_hands": self.bucket_hands,
+            "bucket_seconds": self.bucket_seconds,
+            "hands_seen": self.hands_seen,
+            "hand_clock": self.hand_clock,
+            "totals": {name: list(c) for name, c in self.totals.items()},
+            "buckets": [[key, {name: list(c) for name, c in bucket.items()}] for key, bucket in self.buckets],
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Restores a tracker saved with save()"""
+        with open(path) as f:
+            snapshot = json.load(f)
+        if tuple(snapshot["counters"]) != COUNTERS:
+            raise ValueError("Snapshot was written with a different counter layout")
+
+        tracker = cls(snapshot["window_hands"], snapshot["window_seconds"],
+                      snapshot["bucket_hands"], snapshot["bucket_seconds"])
+        tracker.hands_seen = snapshot["hands_seen"]
+        tracker.hand_clock = snapshot["hand_clock"]
+        tracker.totals = {name: array('q', c) for name, c in snapshot["totals"].items()}
+        tracker.buckets = deque((key, {name: array('q', c) for name, c in bucket.items()})
+                                for key, bucket in snapshot["buckets"])
+        tracker.expire()
+        return tracker
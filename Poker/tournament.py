@@ -0,0 +1,232 @@
+import random
+from functools import lru_cache
+
+import numpy as np
+
+from game import PokerGame
+
+
+# Above this many (DP state, seat) steps the exact ICM gets too slow for per-decision use, so we sample instead.
+# Every state loops over all alive seats, so the work is states * players, not states alone.
+EXACT_ICM_MAX_WORK = 150_000
+
+
+def icm_equities(stacks, payouts, trials=2000, seed=None):
+    """
+    Independent Chip Model: turns chip stacks into prize equities.
+    stacks:  chip counts per player (busted players with 0 chips get 0 equity)
+    payouts: prize for 1st, 2nd, 3rd ... place (places past the list pay nothing)
+    Returns a list of equities in the same order as `stacks`.
+
+    Uses the exact Malmuth-Harville model through a subset DP when it is small enough
+    (up to about 13 players all paid, or a few dozen with 3 paid: tens of milliseconds),
+    otherwise a Monte Carlo estimate with `trials` samples.
+    """
+    stacks = tuple(stacks)
+    payouts = tuple(payouts)
+    alive = sum(1 for s in stacks if s > 0)
+    places = min(len(payouts), alive)
+
+    if icm_state_count(alive, places) * alive <= EXACT_ICM_MAX_WORK:
+        return list(_exact_icm(stacks, payouts[:places]))
+    return _sampled_icm(stacks, payouts[:places], trials, seed)
+
+
+def icm_state_count(num_players, places):
+    """Number of subset states the exact DP visits: all subsets of size < places"""
+    total = 0
+    combos = 1
+    for size in range(places):
+        total += combos
+        combos = combos * (num_players - size) // (size + 1) #C(n, size + 1) from C(n, size)
+    return total
+
+
+@lru_cache(maxsize=4096)
+def _exact_icm(stacks, payouts):
+    """
+    Harville recursion done forward over 'who already finished on top' bitmasks.
+    prob[mask] = chance that exactly the players in mask took the first popcount(mask) places.
+    Each mask is expanded once, so the cost is O(states * players) instead of O(players!).
+    """
+    n = len(stacks)
+    total = sum(stacks)
+    equities = [0.0] * n
+    seats = [i for i in range(n) if stacks[i] > 0]
+
+    level = {0: (1.0, 0)} #mask -> (probability, chips held by players in mask)
+    for payout in payouts:
+        next_level = {}
+        for mask, (prob, taken_chips) in level.items():
+            remaining = total - taken_chips
+            for i in seats:
+                if mask >> i & 1:
+                    continue
+                p = prob * stacks[i] / remaining #i finishes in this place
+                equities[i] += p * payout
+                new_mask = mask | (1 << i)
+                if new_mask in next_level:
+                    next_level[new_mask] = (next_level[new_mask][0] + p, taken_chips + stacks[i])
+                else:
+                    next_level[new_mask] = (p, taken_chips + stacks[i])
+        level = next_level
+
+    return tuple(equities)
+
+
+def _sampled_icm(stacks, payouts, trials, seed):
+    """
+    Monte Carlo ICM for big fields, vectorized over trials.
+    Harville's model (each place goes to a remaining player with probability proportional to chips)
+    is the same as sorting players by exponential keys of rate `stack`, so a batch of finishing orders
+    is one draw plus a partial sort of the `places` smallest keys per trial, whatever the chip spread.
+    """
+    rng = np.random.default_rng(seed)
+    seats = np.array([i for i in range(len(stacks)) if stacks[i] > 0])
+    rates = np.array([stacks[i] for i in seats], dtype=float)
+    places = min(len(payouts), len(seats))
+    prizes = np.array(payouts[:places], dtype=float)
+    totals = np.zeros(len(seats))
+
+    batch = max(1, 2_000_000 // len(seats)) #keep each key matrix around 16 MB
+    for start in range(0, trials, batch):
+        keys = rng.exponential(size=(min(batch, trials - start), len(seats))) / rates
+        if places < len(seats):
+            top = np.argpartition(keys, places - 1, axis=1)[:, :places]
+        else:
+            top = np.tile(np.arange(len(seats)), (len(keys), 1))
+        order = np.take_along_axis(top, np.argsort(np.take_along_axis(keys, top, axis=1), axis=1), axis=1)
+        totals += np.bincount(order.ravel(), weights=np.broadcast_to(prizes, order.shape).ravel(),
+                              minlength=len(seats))
+
+    equities = [0.0] * len(stacks)
+    for seat, total in zip(seats, totals):
+        equities[seat] = float(total / trials)
+    return equities
+
+
+class Tournament:
+    def __init__(self, player_names, starting_chips=1000, blind_schedule=None, hands_per_level=10, table_size=9, payouts=None,
+                 verbose=True, policies=None, listeners=None):
+        """
+        Multi-table freezeout around PokerGame.
+        blind_schedule: list of (small_blind, big_blind) levels; the last level repeats forever
+        payouts:        prize per finishing place, used for ICM equities
+        verbose:        False runs every table headless, tournament messages included
+        policies:       player name -> policy, like PokerGame.policies
+        listeners:      hand event listeners, like PokerGame.listeners
+        Every table shares the same policies dict and listeners list, so bots and trackers follow
+        players through table moves and breaks; add to self.policies / self.listeners later on too.
+        """
+        self.blind_schedule = blind_schedule or [(10, 20), (15, 30), (25, 50), (50, 100), (75, 150), (100, 200)]
+        self.hands_per_level = hands_per_level
+        self.table_size = table_size
+        self.payouts = payouts or [1.0]
+        self.level = 0
+        self.hands_played = 0
+        self.finish_order = [] #busted players, first out first
+        self.tables = []
+        self.policies = {} if policies is None else policies
+        self.listeners = [] if listeners is None else listeners
+
+        players = PokerGame(player_names, starting_chips, verbose=verbose).players
+        num_tables = -(-len(players) // table_size) #ceil division
+        for t in range(num_tables):
+            table = PokerGame([], starting_chips, verbose=verbose)
+            table.players = players[t::num_tables] #deal seats round robin so tables start balanced
+            table.policies = self.policies
+            table.listeners = self.listeners
+            self.tables.append(table)
+
+    def blinds(self):
+        """Current (small_blind, big_blind) for this level"""
+        return self.blind_schedule[min(self.level, len(self.blind_schedule) - 1)]
+
+    def remaining_players(self):
+        return [p for table in self.tables for p in table.players]
+
+    def is_finished(self):
+        return len(self.remaining_players()) <= 1
+
+    def play_hand(self):
+        """Plays one hand on every table, then removes busted players and rebalances"""
+        small_blind, big_blind = self.blinds()
+        for table in self.tables:
+            if len(table.players) < 2:
+                continue
+            stacks_before = {p: p.chips + p.current_bet for p in table.players}
+            table.play_hand(small_blind, big_blind)
+            self.eliminate(table, stacks_before)
+
+        self.balance_tables()
+
+        self.hands_played += 1
+        if self.hands_played % self.hands_per_level == 0 and self.level < len(self.blind_schedule) - 1:
+            self.level += 1
+            self.tables[0].log(f"*** Blinds up: {self.blinds()[0]}/{self.blinds()[1]} ***")
+
+    def eliminate(self, table, stacks_before):
+        """Removes players with 0 chips; players busting on the same hand are placed by starting stack"""
+        busted = [p for p in table.players if p.chips == 0]
+        if not busted:
+            return
+
+        busted.sort(key=lambda p: stacks_before[p]) #smaller starting stack finishes lower
+        for p in busted:
+            seat = table.players.index(p)
+            if seat <= table.dealer: #keep the button on the same player (or the one before)
+                table.dealer -= 1
+            table.players.remove(p)
+            self.finish_order.append(p)
+            table.log(f"{p.name} is eliminated in place {len(self.remaining_players()) + 1}")
+
+        if table.players:
+            table.dealer %= len(table.players)
+        else:
+            table.dealer = 0
+
+    def balance_tables(self):
+        """Breaks tables when the field fits on fewer, and moves players so table sizes differ by at most 1"""
+        remaining = len(self.remaining_players())
+        needed = max(1, -(-remaining // self.table_size))
+
+        while len(self.tables) > needed:
+            broken = min(self.tables, key=lambda t: len(t.players)) #break the shortest table
+            self.tables.remove(broken)
+            for p in broken.players:
+                self.seat_player(min(self.tables, key=lambda t: len(t.players)), p)
+
+        while True:
+            biggest = max(self.tables, key=lambda t: len(t.players))
+            smallest = min(self.tables, key=lambda t: len(t.players))
+            if len(biggest.players) - len(smallest.players) <= 1:
+                break
+            mover_seat = (biggest.dealer + 1) % len(biggest.players) #move the player in the small blind seat, who has the least to lose by changing tables
+            mover = biggest.players.pop(mover_seat)
+            if mover_seat < biggest.dealer:
+                biggest.dealer -= 1
+            biggest.dealer %= len(biggest.players)
+            self.seat_player(smallest, mover)
+
+    def seat_player(self, table, player):
+        """Puts a moved player into the seat just before the button"""
+        player.reset_hand()
+        table.players.insert(table.dealer, player)
+        table.dealer = (table.dealer + 1) % len(table.players)
+
+    def icm(self, trials=2000, seed=0):
+        """ICM equities for everyone still in, as {player name: equity}; seeded so the same state gives the same answer"""
+        players = self.remaining_players()
+        places_left = self.payouts[:len(players)]
+        equities = icm_equities([p.chips for p in players], places_left, trials, seed)
+        return {p.name: eq for p, eq in zip(players, equities)}
+
+    def run(self, max_hands=None):
+        """Plays until one player has all the chips (or max_hands), returns the finishing order, winner first"""
+        while not self.is_finished():
+            if max_hands is not None and self.hands_played >= max_hands:
+                break
+            self.play_hand()
+
+        standing = sorted(self.remaining_players(), key=lambda p: p.chips, reverse=True)
+        return standing + self.finish_order[::-1]
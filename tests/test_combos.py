@@ -0,0 +1,44 @@
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Poker"))
+
+from combos import CARDS, COMBOS, COMBO_COMPATIBLE, board_strengths, showdown_totals, strength_key
+
+
+def reference_strengths(board):
+    board_cards = [CARDS[i] for i in board]
+    return [-1 if a in board or b in board else strength_key([CARDS[a], CARDS[b]] + board_cards)
+            for a, b in COMBOS]
+
+
+def test_board_strengths_match_evaluate_hand():
+    rng = random.Random(7)
+    spades = [i for i, c in enumerate(CARDS) if c.suit == '♠']
+    boards = [rng.sample(range(52), 5) for _ in range(4)]
+    boards += [rng.sample(spades, 5), rng.sample(spades, 3) + rng.sample([i for i in range(52) if i not in spades], 2)]
+    boards.append([i for i, c in enumerate(CARDS) if c.rank == 'A'] + [0]) #quads on board
+    for board in boards:
+        assert board_strengths(board).tolist() == reference_strengths(board)
+
+
+def test_showdown_totals_match_pairwise_loop():
+    rng = random.Random(3)
+    idx = np.array(rng.sample(range(len(COMBOS)), 40))
+    rows = [board_strengths(b, only=idx)[idx] for b in (rng.sample(range(52), 5) for _ in range(25))]
+    compatible = COMBO_COMPATIBLE[np.ix_(idx, idx)]
+    points, counts = showdown_totals(rows, compatible)
+
+    expected_points = np.zeros_like(points)
+    expected_counts = np.zeros_like(counts)
+    for row in rows:
+        for i in range(len(idx)):
+            for j in range(len(idx)):
+                if compatible[i, j] and row[i] >= 0 and row[j] >= 0:
+                    expected_counts[i, j] += 1
+                    expected_points[i, j] += 1.0 if row[i] > row[j] else 0.5 if row[i] == row[j] else 0.0
+    assert np.array_equal(points, expected_points)
+    assert np.array_equal(counts, expected_counts)
@@ -0,0 +1,35 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Poker"))
+
+from equity import range_equity, runouts
+from ranges import parse_cards
+
+
+def test_aces_against_set_of_kings_on_flop():
+    #C(45, 2) = 990 run-outs avoid both hands; aces win 85 of them
+    equity, per_combo = range_equity("AsAh", "KcKh", "Ks9d4c")
+    assert equity == pytest.approx(85 / 990)
+    assert np.count_nonzero(~np.isnan(per_combo)) == 1 #only the hero combo has an equity
+
+
+def test_equity_is_symmetric():
+    hero, _ = range_equity("AQs+, 77+", "KJo, 22-55", "Ks9d4c2h")
+    villain, _ = range_equity("KJo, 22-55", "AQs+, 77+", "Ks9d4c2h")
+    assert hero + villain == pytest.approx(1.0)
+
+
+def test_flop_runouts_are_enumerated():
+    board = parse_cards("Ks9d4c")
+    full = runouts(board)
+    assert len(full) == 1176
+    assert len({tuple(r) for r in full}) == 1176
+
+
+def test_bad_board_is_rejected():
+    with pytest.raises(ValueError):
+        range_equity("AsAh", "KcKh", "Kx9d4c")
@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Poker"))
+
+from deck import Card
+from game import PokerGame
+from hand_evaluator import evaluate_hand, format_hand_result
+
+
+class StackedShuffle:
+    """Stands in for a random.Random: puts the given cards on top of the deck, in order"""
+    def __init__(self, top):
+        self.top = top
+
+    def shuffle(self, cards):
+        wanted = [(c.rank, c.suit) for c in self.top]
+        cards.sort(key=lambda c: wanted.index((c.rank, c.suit)) if (c.rank, c.suit) in wanted else len(wanted))
+
+
+def test_royal_flush_showdown_headless():
+    # seat 0: A♠ K♠, seat 1: 2♥ 7♦, burn, flop Q♠ J♠ 10♠, burn, turn 3♣, burn, river 4♦
+    top = [Card('A', '♠'), Card('K', '♠'), Card('2', '♥'), Card('7', '♦'),
+           Card('5', '♣'), Card('Q', '♠'), Card('J', '♠'), Card('10', '♠'),
+           Card('6', '♣'), Card('3', '♣'), Card('8', '♣'), Card('4', '♦')]
+    game = PokerGame(["A", "B"], 100, verbose=False, rng=StackedShuffle(top))
+    game.play_hand(1, 2)
+
+    assert game.players[0].best_hand[0] == 8
+    assert game.players[0].chips == 102
+    assert game.players[1].chips == 98
+
+
+def test_format_royal_flush():
+    rank_value, tiebreakers, _ = evaluate_hand([Card('A', '♠'), Card('K', '♠'), Card('Q', '♠'),
+                                                Card('J', '♠'), Card('10', '♠'), Card('2', '♥'), Card('7', '♦')])
+    assert format_hand_result(rank_value, tiebreakers) == "Royale Flush"
@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Poker"))
+
+from combos import CLASS_NAMES, COMBO_CARDS, COMBO_CLASS
+from ranges import parse_board, parse_cards, parse_range
+
+
+def classes(weights):
+    """Hand class names with any weight, as a set"""
+    return {CLASS_NAMES[c] for c in np.unique(COMBO_CLASS[weights > 0])}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("77+", {"77", "88", "99", "TT", "JJ", "QQ", "KK", "AA"}),
+    ("A2s+", {f"A{k}s" for k in "KQJT98765432"}),
+    ("KTo+", {"KTo", "KJo", "KQo"}),
+    ("22-55", {"22", "33", "44", "55"}),
+    ("A2s-A5s", {"A2s", "A3s", "A4s", "A5s"}),
+    ("AK", {"AKs", "AKo"}),
+])
+def test_class_tokens(text, expected):
+    assert classes(parse_range(text)) == expected
+
+
+def test_combo_counts_and_weights():
+    weights = parse_range("AA, AKs:0.5, AsKh")
+    assert weights.sum() == 6 + 4 * 0.5 + 1
+    assert set(weights[weights > 0]) == {1.0, 0.5}
+
+
+def test_board_removes_blocked_combos():
+    weights = parse_range("AA, KK", board="As7d2c")
+    assert weights.sum() == 3 + 6
+    blocked = np.isin(COMBO_CARDS, parse_cards("As7d2c")).any(axis=1)
+    assert not weights[blocked].any()
+
+
+@pytest.mark.parametrize("text", ["AKx", "77s", "A5s-K5s", "22-A5s", "AsAs", "AKs:1.5", "Q"])
+def test_malformed_tokens(text):
+    with pytest.raises(ValueError):
+        parse_range(text)
+
+
+@pytest.mark.parametrize("board", ["Kx9d4c", "ks9d4c", "KsKs4c", "Ks9d4c2h3h7s"])
+def test_malformed_boards(board):
+    with pytest.raises(ValueError):
+        parse_board(board)
+
+
+def test_parse_cards_formats():
+    assert parse_cards("Ks9d10c") == parse_cards("K♠ 9♦ T♣")
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+from itertools import permutations
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Poker"))
+
+import tournament
+from game import check_or_call
+from tournament import Tournament, _exact_icm, icm_equities
+
+
+def harville_brute_force(stacks, payouts):
+    """Sums every full finishing order, each place going to a remaining player in proportion to chips"""
+    equities = [0.0] * len(stacks)
+    for order in permutations(range(len(stacks))):
+        prob = 1.0
+        remaining = sum(stacks)
+        for seat in order:
+            prob *= stacks[seat] / remaining
+            remaining -= stacks[seat]
+        for place, seat in enumerate(order[:len(payouts)]):
+            equities[seat] += prob * payouts[place]
+    return equities
+
+
+@pytest.mark.parametrize("payouts", [(50, 30, 20), (40, 25, 15, 10, 6, 3, 1)])
+def test_exact_icm_matches_harville(payouts):
+    stacks = (1200, 300, 4500, 800, 800, 2500, 60)
+    assert _exact_icm(stacks, payouts) == pytest.approx(harville_brute_force(stacks, payouts))
+
+
+def test_large_field_uses_sampling(monkeypatch):
+    def too_slow(stacks, payouts):
+        raise AssertionError("300 players with 3 paid must not take the exact path")
+
+    monkeypatch.setattr(tournament, "_exact_icm", too_slow)
+    stacks = [1000 + 37 * i for i in range(300)]
+    start = time.perf_counter()
+    equities = icm_equities(stacks, [50, 30, 20], seed=0)
+    assert time.perf_counter() - start < 0.5
+    assert sum(equities) == pytest.approx(100)
+
+
+def test_policies_and_listeners_follow_moved_players():
+    class ActionCounter:
+        actions = 0
+
+        def on_action(self, game, actor_index, act):
+            self.actions += 1
+
+    policy_calls = []
+
+    def counting_policy(game, actor_index, actions):
+        policy_calls.append(game.players[actor_index].name)
+        return check_or_call(game, actor_index, actions)
+
+    names = [f"P{i}" for i in range(7)]
+    counter = ActionCounter()
+    t = Tournament(names, 200, blind_schedule=[(20, 40), (50, 100)], hands_per_level=3, table_size=3,
+                   verbose=False, policies={n: counting_policy for n in names}, listeners=[counter])
+    t.run(max_hands=200)
+
+    assert len(t.tables) == 1 #tables were broken, so players were moved
+    assert counter.actions > 0
+    assert len(policy_calls) == counter.actions #no moved player fell back to the default policy